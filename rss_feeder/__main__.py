@@ -2,10 +2,10 @@
 import os
 import signal
 import logging
+import threading
 import time
 import sys
 import atexit
-from concurrent.futures import ThreadPoolExecutor
 import uvicorn
 from fastapi import FastAPI
 from prometheus_fastapi_instrumentator import Instrumentator
@@ -64,8 +64,8 @@ class Application:
     def __init__(self):
         set_application(self)
         self.scheduler = None
-        self.executor = None
         self.process_manager = ProcessManager()
+        self._shutdown_event = threading.Event()
         self._init_logging()
         self.logger = logging.getLogger('main')
         self.start_time = time.time()
@@ -96,15 +96,15 @@ class Application:
         """Main application entry point"""
         try:
             # Start services
-            self.executor = ThreadPoolExecutor(max_workers=3)
             self.scheduler = FeedScheduler()
 
             # Register signal handlers
             signal.signal(signal.SIGINT, self._shutdown)
             signal.signal(signal.SIGTERM, self._shutdown)
 
-            # Start components
-            self.executor.submit(self._run_uvicorn)
+            # Start components — a plain daemon thread is all the single
+            # uvicorn server needs; no executor/futures machinery required
+            threading.Thread(target=self._run_uvicorn, daemon=True, name='uvicorn').start()
             self.scheduler.start()
 
             self.logger.info("Application started (PID: %d)", os.getpid())
@@ -117,23 +117,36 @@ class Application:
 
     def _run_uvicorn(self):
         """Run Uvicorn server."""
+        try:
+            # uvloop (libuv) + httptools (C parser) when available; stdlib
+            # asyncio + h11 otherwise
+            import uvloop  # noqa: F401
+            import httptools  # noqa: F401
+            loop_impl, http_impl = "uvloop", "httptools"
+        except ImportError:
+            loop_impl, http_impl = "auto", "auto"
+
         config = uvicorn.Config(
             app=app,
             host="0.0.0.0",
             port=8000,
             log_level="info",
             access_log=False,
-            timeout_keep_alive=60
+            timeout_keep_alive=60,
+            loop=loop_impl,
+            http=http_impl
         )
         server = uvicorn.Server(config)
         server.run()
 
     def _monitor_activity(self):
         """Main monitoring loop"""
-        while not getattr(self, '_shutdown_flag', False):
+        while not self._shutdown_event.is_set():
             try:
                 self._log_system_status()
-                time.sleep(30)
+                # Event.wait wakes immediately on shutdown instead of
+                # finishing out a time.sleep
+                self._shutdown_event.wait(30)
             except KeyboardInterrupt:
                 self._shutdown()
             except Exception as e:
@@ -161,10 +174,10 @@ class Application:
 
     def _shutdown(self, signum=None, frame=None):
         """Graceful shutdown procedure"""
-        if getattr(self, '_shutdown_flag', False):
+        if self._shutdown_event.is_set():
             return
 
-        self._shutdown_flag = True
+        self._shutdown_event.set()
         self.logger.info("Initiating shutdown sequence...")
 
         shutdown_start = time.time()
@@ -177,14 +190,6 @@ class Application:
             except Exception as e:
                 self.logger.error("Scheduler shutdown error: %s", str(e))
 
-        # Then executor
-        if self.executor:
-            try:
-                self.logger.info("Stopping executor...")
-                self.executor.shutdown(wait=True, cancel_futures=True)
-            except Exception as e:
-                self.logger.error("Executor shutdown error: %s", str(e))
-
         # Force cleanup if needed
         self.process_manager.cleanup()
 
@@ -22,6 +22,7 @@ ARTICLES_OUTPUT_DIR = os.path.join(OUTPUTS_DIR, "articles")
 XMLS_OUTPUT_DIR = os.path.join(OUTPUTS_DIR, "xmls")
 ARTICLES_JSON_FILE = os.path.join(ARTICLES_OUTPUT_DIR, "articles.json")
 FEEDS_FILE = os.path.join(DATA_DIR, "feeds.json")
+FEED_STATE_FILE = os.path.join(DATA_DIR, "feed_state.json")
 DEFAULT_ENCODING = 'utf-8'
 
 # ========== Fetcher/Request Settings ==========
@@ -29,7 +30,7 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 
 DEFAULT_HEADERS = {
     "User-Agent": USER_AGENT,
-    "Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8"
+    "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8"
 }
 REQUEST_TIMEOUT = 10  # seconds
 RATE_LIMIT_DELAY = 1  # seconds between requests
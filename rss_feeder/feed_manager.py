@@ -1,14 +1,26 @@
 # rss_feeder/feed_manager.py
-import json
 import logging
 import os
-from typing import List, Dict
+import tempfile
+import threading
+from typing import Callable, List, Dict, Optional
 from datetime import datetime
+
+import orjson
+
 from rss_feeder import config
 
 class FeedManager:
     """Manage RSS feed configurations with validation and deduplication"""
 
+    FLUSH_DELAY = 5.0  # seconds to coalesce status updates before writing
+
+    # Class-level hook invoked with the validated feed list whenever any
+    # instance actually re-reads the feeds file. The fetcher, scheduler, and
+    # health app each hold their own FeedManager, so an instance attribute
+    # would only see reloads on the instance it was set on.
+    on_change: Optional[Callable[[List[Dict]], None]] = None
+
     def __init__(self, feeds_file: str = None):
         self._package_feeds = os.path.join(
             os.path.dirname(os.path.abspath(__file__)), 'feeds.json'
@@ -20,6 +32,9 @@ class FeedManager:
         self.logger = logging.getLogger('feed_manager')
         self.last_modified = 0
         self.cached_feeds = None
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_lock = threading.Lock()
 
     def load_feeds(self) -> List[Dict]:
         """Load and validate feeds from JSON file with caching and deduplication"""
@@ -29,8 +44,8 @@ class FeedManager:
             if self.cached_feeds and file_mtime <= self.last_modified:
                 return self.cached_feeds
 
-            with open(self.feeds_file, 'r', encoding='utf-8') as f:
-                feeds = json.load(f)
+            with open(self.feeds_file, 'rb') as f:
+                feeds = orjson.loads(f.read())
 
             validated_feeds = []
             seen = set()  # Track (name, url) pairs for deduplication
@@ -44,9 +59,18 @@ class FeedManager:
 
             self.cached_feeds = validated_feeds
             self.last_modified = file_mtime
+
+            # Read off the class so a plain function isn't bound as a method
+            callback = FeedManager.on_change
+            if callback is not None:
+                try:
+                    callback(validated_feeds)
+                except Exception as e:
+                    self.logger.warning("on_change callback failed: %s", str(e))
+
             return validated_feeds
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.error("Invalid JSON in feeds file: %s", str(e))
             return []
         except Exception as e:
@@ -84,25 +108,50 @@ class FeedManager:
         }
 
     def update_feed_status(self, feed_name: str, status: Dict):
-        """Update feed status in the configuration file"""
+        """Update feed status in memory; changes flush to disk on a debounce.
+
+        The cached feed list is authoritative between flushes, so frequent
+        per-poll status updates no longer rewrite feeds.json each time.
+        """
         try:
-            with open(self.feeds_file, 'r+', encoding='utf-8') as f:
-                feeds = json.load(f)
-                for feed in feeds:
-                    if feed['name'] == feed_name:
-                        feed.update(status)
-                        feed['last_updated'] = datetime.utcnow().isoformat()
-                        break
-
-                f.seek(0)
-                json.dump(feeds, f, indent=2)
-                f.truncate()
-
-            # Invalidate cache
-            self.cached_feeds = None
+            feeds = self.load_feeds()
+            for feed in feeds:
+                if feed['name'] == feed_name:
+                    feed.update(status)
+                    feed['last_updated'] = datetime.utcnow().isoformat()
+                    break
+
+            with self._flush_lock:
+                self._dirty = True
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
         except Exception as e:
             self.logger.error("Error updating feed status: %s", str(e))
 
+    def flush(self) -> None:
+        """Write pending feed-status changes to disk atomically."""
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty or self.cached_feeds is None:
+                return
+            self._dirty = False
+            feeds = list(self.cached_feeds)
+
+        try:
+            directory = os.path.dirname(self.feeds_file) or '.'
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(feeds, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_path, self.feeds_file)
+            # Keep the cache valid against the file we just wrote
+            self.last_modified = os.path.getmtime(self.feeds_file)
+        except Exception as e:
+            self.logger.error("Error flushing feed status: %s", str(e))
+
     def get_active_feeds(self) -> List[Dict]:
         """Return only active feeds"""
         return [feed for feed in self.load_feeds() if feed.get('active', True)]
@@ -62,11 +62,58 @@ def verify_api_key(api_key: str = Security(api_key_header)):
     if not expected_key or api_key != expected_key:
         raise HTTPException(status_code=403, detail="Invalid API Key")
 
+# System stats are sampled by a background task rather than per request:
+# psutil's cpu_percent and the storage-directory listings scan /proc and the
+# filesystem, which adds up under frequent Prometheus scrapes.
+_SYSTEM_STATS: Dict[str, Any] = {}
+_STATS_SAMPLE_INTERVAL = 2.0
+
+
+def _sample_system_stats() -> Dict[str, Any]:
+    """Collect one snapshot of system + storage stats (blocking)."""
+    return {
+        "cpu": psutil.cpu_percent(),
+        "memory": psutil.virtual_memory().percent,
+        "disk": psutil.disk_usage('/').percent,
+        "uptime": timedelta(seconds=psutil.boot_time()).total_seconds(),
+        "storage": {
+            "raw_feeds": len(os.listdir(config.RAW_FEEDS_DIR)) if os.path.isdir(config.RAW_FEEDS_DIR) else 0,
+            "parsed_articles": len(os.listdir(config.PARSED_ARTICLES_DIR)) if os.path.isdir(config.PARSED_ARTICLES_DIR) else 0
+        }
+    }
+
+
+async def _stats_sampler() -> None:
+    """Refresh _SYSTEM_STATS periodically off the request path."""
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            _SYSTEM_STATS.update(await loop.run_in_executor(None, _sample_system_stats))
+        except Exception as e:
+            logging.warning(f"System stats sampling failed: {e}")
+        await asyncio.sleep(_STATS_SAMPLE_INTERVAL)
+
+
 @app.on_event("startup")
 async def startup_event():
-    """Initialize monitoring metrics"""
+    """Initialize monitoring metrics and the stats sampler"""
+    # The class-level hook fires whenever any FeedManager (scheduler's,
+    # fetcher's, or this one) re-reads the feeds file, so the gauge tracks
+    # changes no matter which component triggered the reload
+    FeedManager.on_change = lambda feeds: FEED_GAUGE.set(len(feeds))
     feed_manager = FeedManager()
-    FEED_GAUGE.set(len(feed_manager.load_feeds()))
+    feed_manager.load_feeds()
+    app.state.feed_manager = feed_manager
+    _SYSTEM_STATS.update(_sample_system_stats())
+    app.state.stats_task = asyncio.create_task(_stats_sampler())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the stats sampler"""
+    task = getattr(app.state, 'stats_task', None)
+    if task is not None:
+        task.cancel()
 
 async def check_kafka() -> bool:
     """Verify Kafka connectivity via TCP socket."""
@@ -105,20 +152,18 @@ async def health_check() -> Dict:
         try:
             scheduler = _get_scheduler()
 
+            system = _SYSTEM_STATS or _sample_system_stats()
             stats = {
                 "system": {
-                    "cpu": psutil.cpu_percent(),
-                    "memory": psutil.virtual_memory().percent,
-                    "disk": psutil.disk_usage('/').percent,
-                    "uptime": timedelta(seconds=psutil.boot_time()).total_seconds()
+                    "cpu": system["cpu"],
+                    "memory": system["memory"],
+                    "disk": system["disk"],
+                    "uptime": system["uptime"]
                 },
                 "services": {
                     "kafka": await check_kafka(),
                     "scheduler": await check_scheduler(scheduler),
-                    "storage": {
-                        "raw_feeds": len(os.listdir(config.RAW_FEEDS_DIR)) if os.path.isdir(config.RAW_FEEDS_DIR) else 0,
-                        "parsed_articles": len(os.listdir(config.PARSED_ARTICLES_DIR)) if os.path.isdir(config.PARSED_ARTICLES_DIR) else 0
-                    }
+                    "storage": system["storage"]
                 }
             }
 
@@ -14,6 +14,8 @@ class MessagePublisher(Protocol):
 
     def publish(self, topic: str, message: Dict[str, Any]) -> bool: ...
 
+    def publish_many(self, topic: str, messages: List[Dict[str, Any]], validate: bool = True) -> int: ...
+
     def flush(self) -> None: ...
 
     def close(self) -> None: ...
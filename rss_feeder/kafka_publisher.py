@@ -1,10 +1,17 @@
 # rss_feeder/kafka_publisher.py
-import json
 import logging
 from datetime import datetime
 from typing import Callable, Dict, Any, Optional
+
+import orjson
 from kafka import KafkaProducer
 from kafka.errors import KafkaError
+
+try:  # librdkafka-backed producer, used automatically when installed
+    from confluent_kafka import Producer as ConfluentProducer
+except ImportError:
+    ConfluentProducer = None
+
 from rss_feeder import config
 
 
@@ -13,18 +20,90 @@ def _default_validate(message: Dict[str, Any]) -> bool:
     return True
 
 
+class _ConfluentFuture:
+    """Matches the add_callback/add_errback surface of kafka-python futures."""
+
+    __slots__ = ('_callbacks', '_errbacks')
+
+    def __init__(self):
+        self._callbacks = []
+        self._errbacks = []
+
+    def add_callback(self, fn, *args) -> None:
+        self._callbacks.append((fn, args))
+
+    def add_errback(self, fn, *args) -> None:
+        self._errbacks.append((fn, args))
+
+    def _resolve(self, err, msg) -> None:
+        if err is not None:
+            for fn, args in self._errbacks:
+                fn(*args, err)
+        else:
+            for fn, args in self._callbacks:
+                fn(*args, msg)
+
+
+class _ConfluentProducerAdapter:
+    """kafka-python-shaped facade over confluent_kafka.Producer.
+
+    librdkafka does serialization, batching, and network I/O in C, cutting
+    the per-message Python cost dramatically; the facade keeps KafkaPublisher
+    and its callers unchanged.
+    """
+
+    def __init__(self):
+        self._producer = ConfluentProducer({
+            'bootstrap.servers': config.KAFKA_BROKER_URL,
+            'linger.ms': 100,
+            'batch.size': 262144,
+            'compression.type': 'lz4',
+            'acks': '1',
+            'queue.buffering.max.messages': 1000000,
+        })
+
+    def send(self, topic: str, value: Dict[str, Any]) -> _ConfluentFuture:
+        future = _ConfluentFuture()
+        self._producer.produce(topic, orjson.dumps(value), on_delivery=future._resolve)
+        self._producer.poll(0)  # service delivery callbacks without blocking
+        return future
+
+    def partitions_for(self, topic: str):
+        metadata = self._producer.list_topics(topic, timeout=5)
+        return set(metadata.topics[topic].partitions)
+
+    def flush(self) -> None:
+        self._producer.flush()
+
+    def close(self) -> None:
+        self._producer.flush()
+
+
 class KafkaPublisher:
     """Handles publishing messages to Kafka topics with DQL handling."""
 
     def __init__(self, validate_func: Optional[Callable[[Dict[str, Any]], bool]] = None):
         self._validate = validate_func or _default_validate
+        self.logger = logging.getLogger('kafka_publisher')
+        if ConfluentProducer is not None:
+            self.producer = _ConfluentProducerAdapter()
+            return
+        # Batch-friendly producer settings: linger lets multiple articles
+        # coalesce into one ProduceRequest, lz4 keeps those batches small on
+        # the wire, and acks=1 avoids waiting on full ISR replication.
         self.producer = KafkaProducer(
             bootstrap_servers=[config.KAFKA_BROKER_URL],
-            value_serializer=lambda v: json.dumps(v).encode('utf-8'),
-            retries=3,
-            max_in_flight_requests_per_connection=1
+            value_serializer=orjson.dumps,  # emits bytes directly, no encode pass
+            linger_ms=100,
+            batch_size=262144,
+            compression_type='lz4',
+            acks=1,
+            max_in_flight_requests_per_connection=5
         )
-        self.logger = logging.getLogger('kafka_publisher')
+
+    def set_validate(self, validate_func: Callable[[Dict[str, Any]], bool]) -> None:
+        """Bind the message validator once; publish() calls it directly."""
+        self._validate = validate_func
 
     def publish(self, topic: str, message: Dict[str, Any]) -> bool:
         """Publish message to Kafka topic with error handling."""
@@ -42,6 +121,28 @@ class KafkaPublisher:
             self._handle_invalid_message(message, str(e))
             return False
 
+    def publish_many(self, topic: str, messages, validate: bool = True) -> int:
+        """Publish an iterable of messages in one tight loop.
+
+        Sends go straight into the producer's batch buffer without a
+        per-message flush, so the linger window coalesces the whole batch.
+        Returns the number of messages enqueued.
+        """
+        sent = 0
+        for message in messages:
+            if validate and not self._validate(message):
+                self._handle_invalid_message(message, "Invalid article structure")
+                continue
+            try:
+                future = self.producer.send(topic, value=message)
+                future.add_callback(self._on_send_success, topic)
+                future.add_errback(self._on_send_error, topic, message)
+                sent += 1
+            except Exception as e:
+                self.logger.error(f"Failed to publish to {topic}: {str(e)}")
+                self._handle_invalid_message(message, str(e))
+        return sent
+
     def _on_send_success(self, topic: str, record_metadata) -> None:
         self.logger.debug(f"Successfully published to {topic} partition {record_metadata.partition}")
 
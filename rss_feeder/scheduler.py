@@ -2,7 +2,7 @@ import asyncio
 import random
 import time
 import logging
-import hashlib
+import zlib
 from typing import Dict, Optional
 from datetime import datetime, timedelta
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -25,14 +25,16 @@ class FeedScheduler:
             }
         )
         self.fetcher = RSSFetcher()
+        self.feed_manager = FeedManager()
         self.feed_intervals: Dict[str, int] = {}
         self.feed_errors: Dict[str, int] = {}
+        self.feed_job_ids: Dict[str, str] = {}
         self.logger = logging.getLogger('feed_scheduler')
         self._load_feed_configs()
 
     def _load_feed_configs(self) -> None:
         """Initialize intervals from active feed configurations."""
-        feeds = FeedManager().get_active_feeds()
+        feeds = self.feed_manager.get_active_feeds()
         for feed in feeds:
             feed_name = feed.get('name')
             if feed_name:
@@ -48,7 +50,7 @@ class FeedScheduler:
         except Exception as e:
             self.logger.warning("Error clearing existing jobs: %s", str(e))
 
-        feeds = FeedManager().get_active_feeds()
+        feeds = self.feed_manager.get_active_feeds()
         batch_size = 50
         total_feeds = len(feeds)
         job_index = 0
@@ -74,7 +76,8 @@ class FeedScheduler:
         if not feed_name or not feed_url:
             return
 
-        url_hash = hashlib.md5(feed_url.encode()).hexdigest()[:8]
+        # crc32 is plenty for disambiguating job ids and far cheaper than md5
+        url_hash = f"{zlib.crc32(feed_url.encode()):08x}"
         job_id = f"{feed_name}_{url_hash}"
 
         try:
@@ -104,6 +107,7 @@ class FeedScheduler:
                 coalesce=True,
                 priority=config.FEED_PRIORITIES.get(priority, 2)
             )
+            self.feed_job_ids[feed_name] = job_id
             self.logger.debug("Registered job for %s (interval: %ds)", feed_name, interval)
         except Exception as e:
             self.logger.error("Failed to register job for %s: %s", feed_name, str(e))
@@ -139,7 +143,7 @@ class FeedScheduler:
             processed = self.fetcher._process_feed_entries(feed_data.entries, feed_name, feed_url)
             if processed > 0:
                 self._adjust_interval_based_on_activity(feed_name, feed_data)
-                FeedManager().update_feed_status(feed_name, {
+                self.feed_manager.update_feed_status(feed_name, {
                     'last_success': datetime.utcnow().isoformat(),
                     'error_count': 0
                 })
@@ -156,7 +160,7 @@ class FeedScheduler:
         backoff += random.uniform(0, config.JITTER_SECONDS)
 
         self._update_feed_interval(feed_name, int(backoff))
-        FeedManager().update_feed_status(feed_name, {
+        self.feed_manager.update_feed_status(feed_name, {
             'last_error': datetime.utcnow().isoformat(),
             'error_count': error_count
         })
@@ -202,10 +206,12 @@ class FeedScheduler:
         if not current_interval or abs(current_interval - new_interval) > 60:
             self.feed_intervals[feed_name] = new_interval
             try:
-                jobs = [job for job in self.scheduler.get_jobs()
-                       if job.name == f"Poll {feed_name}"]
-                if jobs:
-                    jobs[0].reschedule(IntervalTrigger(
+                # Direct lookup by the id recorded in _add_feed_job — no
+                # linear scan over every registered job
+                job_id = self.feed_job_ids.get(feed_name)
+                job = self.scheduler.get_job(job_id) if job_id else None
+                if job:
+                    job.reschedule(IntervalTrigger(
                         seconds=new_interval,
                         jitter=config.JITTER_SECONDS
                     ))
@@ -219,6 +225,7 @@ class FeedScheduler:
         self.logger.info("Initiating scheduler shutdown...")
         try:
             self.scheduler.shutdown(wait=True)
+            self.feed_manager.flush()
             asyncio.run(self.fetcher.close())
             self.logger.info("Scheduler shutdown complete")
         except Exception as e:
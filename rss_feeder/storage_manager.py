@@ -1,11 +1,45 @@
 # rss_feeder/storage_manager.py
 
+import logging
 import os
-import json
 from datetime import datetime
+from logging.handlers import RotatingFileHandler
 from typing import List, Dict, Any
+
+import orjson
+
 from rss_feeder import config
 
+# Directories only need to be ensured once per process; every RSSFetcher
+# constructs a StorageManager, so repeat instantiations skip the stat calls
+_DIRS_READY = False
+
+# One rotating handler per log file, created lazily and kept open for the
+# life of the process — log writes hit an already-open buffered stream
+# instead of paying open()/close() per message
+_LOG_LOGGERS: Dict[str, logging.Logger] = {}
+
+
+def _get_log_logger(filename: str) -> logging.Logger:
+    log_logger = _LOG_LOGGERS.get(filename)
+    if log_logger is None:
+        log_logger = logging.getLogger(f"storage.{filename}")
+        log_logger.propagate = False
+        log_logger.setLevel(logging.INFO)
+        try:
+            handler = RotatingFileHandler(
+                os.path.join(config.LOGS_DIR, filename),
+                maxBytes=50 * 1024 * 1024,
+                backupCount=5,
+                encoding=config.DEFAULT_ENCODING,
+            )
+            handler.setFormatter(logging.Formatter('[%(asctime)s] %(message)s'))
+            log_logger.addHandler(handler)
+        except (PermissionError, FileNotFoundError):
+            pass
+        _LOG_LOGGERS[filename] = log_logger
+    return log_logger
+
 
 class StorageManager:
     """Handles reading and writing files such as articles, raw feeds, and logs."""
@@ -14,12 +48,16 @@ class StorageManager:
     COMPACTION_SIZE_BYTES = 100 * 1024 * 1024  # 100 MB
 
     def __init__(self):
+        global _DIRS_READY
+        if _DIRS_READY:
+            return
         for d in (config.RAW_FEEDS_DIR, config.PARSED_ARTICLES_DIR, config.LOGS_DIR,
                   config.ARTICLES_OUTPUT_DIR, config.XMLS_OUTPUT_DIR):
             try:
                 os.makedirs(d, exist_ok=True)
             except PermissionError:
                 pass
+        _DIRS_READY = True
 
     def save_raw_feed(self, feed_content: str, feed_name: str) -> str:
         """Save the raw XML feed content."""
@@ -35,15 +73,17 @@ class StorageManager:
         filename = f"{feed_name}_{timestamp}.json" if timestamp else f"{feed_name}.json"
         filename = filename.replace(":", "-")
         path = os.path.join(config.PARSED_ARTICLES_DIR, filename)
-        with open(path, 'w', encoding=config.DEFAULT_ENCODING) as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(articles, option=orjson.OPT_INDENT_2))
         return path
 
     def save_articles_to_master(self, new_articles: List[Dict[str, Any]]) -> None:
         """Append articles as JSONL lines. Compacts when file exceeds threshold."""
-        with open(self.ARTICLES_FILE, 'a', encoding=config.DEFAULT_ENCODING) as f:
-            for article in new_articles:
-                f.write(json.dumps(article, ensure_ascii=False) + '\n')
+        with open(self.ARTICLES_FILE, 'ab') as f:
+            f.write(b''.join(
+                orjson.dumps(article, option=orjson.OPT_APPEND_NEWLINE)
+                for article in new_articles
+            ))
 
         if os.path.getsize(self.ARTICLES_FILE) > self.COMPACTION_SIZE_BYTES:
             self._compact_articles()
@@ -53,23 +93,25 @@ class StorageManager:
         seen: set = set()
         deduped: list = []
         try:
-            with open(self.ARTICLES_FILE, 'r', encoding=config.DEFAULT_ENCODING) as f:
+            with open(self.ARTICLES_FILE, 'rb') as f:
                 for line in f:
                     line = line.strip()
                     if not line:
                         continue
                     try:
-                        article = json.loads(line)
-                    except json.JSONDecodeError:
+                        article = orjson.loads(line)
+                    except orjson.JSONDecodeError:
                         continue
                     link = article.get('link')
                     if link and link not in seen:
                         seen.add(link)
                         deduped.append(article)
 
-            with open(self.ARTICLES_FILE, 'w', encoding=config.DEFAULT_ENCODING) as f:
-                for article in deduped:
-                    f.write(json.dumps(article, ensure_ascii=False) + '\n')
+            with open(self.ARTICLES_FILE, 'wb') as f:
+                f.write(b''.join(
+                    orjson.dumps(article, option=orjson.OPT_APPEND_NEWLINE)
+                    for article in deduped
+                ))
         except FileNotFoundError:
             pass
 
@@ -78,20 +120,16 @@ class StorageManager:
         if not os.path.exists(self.ARTICLES_FILE):
             return []
         articles = []
-        with open(self.ARTICLES_FILE, 'r', encoding=config.DEFAULT_ENCODING) as f:
+        with open(self.ARTICLES_FILE, 'rb') as f:
             for line in f:
                 line = line.strip()
                 if line:
                     try:
-                        articles.append(json.loads(line))
-                    except json.JSONDecodeError:
+                        articles.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
                         continue
         return articles
 
     def save_log(self, message: str, filename: str = "default.log") -> None:
-        """Save a log message."""
-        path = os.path.join(config.LOGS_DIR, filename)
-        timestamp = datetime.utcnow().isoformat()
-        log_entry = f"[{timestamp}] {message}\n"
-        with open(path, 'a', encoding=config.DEFAULT_ENCODING) as f:
-            f.write(log_entry)
+        """Save a log message through a persistent rotating handler."""
+        _get_log_logger(filename).info(message)
@@ -1,12 +1,47 @@
 # rss_feeder/validator.py
 
 import os
-import json
-import xml.etree.ElementTree as ET
 import logging
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit
+
+import fastjsonschema
+import orjson
+
 from rss_feeder import config
 
+# Compiled once at import: a single generated-code call checks the article's
+# structure instead of per-field Python predicates on every entry.
+_validate_article_schema = fastjsonschema.compile({
+    "type": "object",
+    "required": ["title", "link", "published"],
+    "properties": {
+        "title": {"type": "string", "minLength": 1},
+        "link": {"type": "string", "minLength": 1},
+        "published": {"type": "string", "minLength": 1},
+    },
+})
+
+
+@lru_cache(maxsize=4096)
+def _parse_published(published: str) -> Optional[datetime]:
+    """Parse an RFC-822 (RSS) or ISO-8601 (Atom) date string, cached.
+
+    Feeds repeat the same date strings across polls, so the cache turns the
+    common case into a dict lookup. Returns None when unparseable.
+    """
+    try:
+        return parsedate_to_datetime(published)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(published.replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        return None
+
 # Ensure failed_articles folder exists (ignore if no permission — Docker handles this)
 try:
     os.makedirs(config.FAILED_ARTICLES_FOLDER, exist_ok=True)
@@ -36,19 +71,51 @@ class Validator:
         self.kafka_publisher = kafka_publisher
 
     @staticmethod
-    def validate_feed_xml(xml_content: str) -> bool:
-        """Validates if XML content is a valid RSS feed."""
-        try:
-            root = ET.fromstring(xml_content)
-            return root.tag.lower() == "rss" or root.tag.lower().endswith("rss")
-        except ET.ParseError:
-            return False
+    def validate_feed_xml(xml_content: Any) -> bool:
+        """Checks whether content looks like an RSS or Atom feed.
+
+        A prefix sniff on the first 512 bytes replaces a full document parse:
+        the root element of a feed appears right after the XML declaration,
+        so this is O(1) regardless of document size.
+        """
+        if isinstance(xml_content, bytes):
+            head = xml_content[:512].lstrip().lower()
+            return b'<rss' in head or b'<feed' in head
+        if isinstance(xml_content, str):
+            head = xml_content[:512].lstrip().lower()
+            return '<rss' in head or '<feed' in head
+        return False
+
+    @staticmethod
+    def is_valid_link(link: Any) -> bool:
+        """Checks if a link is an http(s) URL with a host.
+
+        A tuple-startswith plus an authority check is far cheaper than a
+        regex for this trivial shape.
+        """
+        return (isinstance(link, str)
+                and link.startswith(('http://', 'https://'))
+                and bool(urlsplit(link).netloc))
+
+    @staticmethod
+    def is_valid_published(published: Any) -> bool:
+        """Checks if a published date parses as RFC-822 or ISO-8601."""
+        return isinstance(published, str) and _parse_published(published) is not None
 
     @staticmethod
     def validate_article(article: Dict[str, Any]) -> bool:
-        """Checks if an article has required fields."""
-        required_fields = ['title', 'link', 'published']
-        return all(field in article and article[field] for field in required_fields)
+        """Checks if an article has required fields and a parseable date."""
+        # Three boolean ANDs reject empty/missing fields without paying for
+        # the schema's exception construction — the common failure shape
+        if not (article.get('title') and article.get('link')
+                and article.get('published')):
+            return False
+        try:
+            _validate_article_schema(article)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return (Validator.is_valid_link(article['link'])
+                and Validator.is_valid_published(article['published']))
 
     def filter_valid_articles(self, articles: List[Dict[str, Any]], feed_name: str = "UnknownFeed") -> List[Dict[str, Any]]:
         """Filters valid articles. Logs and saves invalid ones."""
@@ -63,32 +130,33 @@ class Validator:
                 logger.info(f"Invalid article from {feed_name}: {article}")
                 self.failed_articles_counter[feed_name] = self.failed_articles_counter.get(feed_name, 0) + 1
 
-                # Send to dead-letter Kafka topic
-                if config.SEND_TO_DEAD_LETTER_TOPIC and self.kafka_publisher is not None:
-                    self.kafka_publisher.publish(self.dead_letter_topic, article)
-
-        # Save invalid articles to JSON file
         if invalid_articles:
+            # One batched send to the dead-letter topic instead of a publish
+            # per invalid article; validation is skipped since these are
+            # known-invalid by construction
+            if config.SEND_TO_DEAD_LETTER_TOPIC and self.kafka_publisher is not None:
+                self.kafka_publisher.publish_many(self.dead_letter_topic, invalid_articles,
+                                                  validate=False)
             self.save_failed_articles(invalid_articles, feed_name)
 
         return valid_articles
 
     @staticmethod
     def save_failed_articles(articles: List[Dict[str, Any]], feed_name: str) -> None:
-        """Appends invalid articles into a failed_articles.json file."""
-        failed_articles_file = os.path.join(config.FAILED_ARTICLES_FOLDER, "failed_articles.json")
-
-        if os.path.exists(failed_articles_file):
-            with open(failed_articles_file, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-        else:
-            existing_data = {}
-
-        existing_data.setdefault(feed_name, [])
-        existing_data[feed_name].extend(articles)
-
-        with open(failed_articles_file, 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, indent=4)
+        """Appends invalid articles to a failed_articles.jsonl file.
+
+        Append-only JSON Lines with the feed name embedded per record — each
+        call is O(batch) instead of re-reading and rewriting the accumulated
+        failure history.
+        """
+        failed_articles_file = os.path.join(config.FAILED_ARTICLES_FOLDER, "failed_articles.jsonl")
+
+        with open(failed_articles_file, 'ab') as f:
+            f.write(b''.join(
+                orjson.dumps({'feed': feed_name, 'article': article},
+                             option=orjson.OPT_APPEND_NEWLINE)
+                for article in articles
+            ))
 
     @classmethod
     def print_failure_summary(cls) -> None:
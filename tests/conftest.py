@@ -0,0 +1,22 @@
+# tests/conftest.py
+
+from contextlib import ExitStack
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(scope='session')
+def fetcher_patches():
+    """Patch RSSFetcher's collaborators once per worker.
+
+    Entering and exiting three patches per test function dominates setup
+    time for the fetcher tests; the mocks stay in place for the session
+    and individual tests reset them instead.
+    """
+    with ExitStack() as stack:
+        mocks = {
+            name: stack.enter_context(patch(f'rss_feeder.rss_fetcher.{name}'))
+            for name in ('StorageManager', 'Validator', 'KafkaPublisher')
+        }
+        yield mocks
@@ -1,6 +1,6 @@
 # tests/test_kafka_publisher.py
+import orjson
 import pytest
-from unittest.mock import Mock, patch, MagicMock
 from rss_feeder import config
 
 
@@ -12,62 +12,167 @@ def _always_invalid(message):
     return False
 
 
+class DummyFuture:
+    def add_callback(self, *args, **kwargs):
+        return self
+
+    def add_errback(self, *args, **kwargs):
+        return self
+
+
+class DummyProducer:
+    """Minimal recording stand-in for KafkaProducer.
+
+    A plain class with a list of sent messages is faster to construct
+    than a MagicMock and makes assertions read as data comparisons.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.sent = []  # (topic, message) pairs
+        self.send_error = None
+        self.flush_calls = 0
+        self.close_calls = 0
+
+    def send(self, topic, value=None):
+        if self.send_error is not None:
+            raise self.send_error
+        self.sent.append((topic, value))
+        return DummyFuture()
+
+    def flush(self, *args, **kwargs):
+        self.flush_calls += 1
+
+    def close(self, *args, **kwargs):
+        self.close_calls += 1
+
+
+class DummyConfluentProducer:
+    """Records produce calls; stands in for confluent_kafka.Producer."""
+
+    def __init__(self, conf):
+        self.conf = conf
+        self.produced = []  # (topic, payload) pairs
+        self.poll_calls = 0
+        self.flush_calls = 0
+
+    def produce(self, topic, value=None, on_delivery=None):
+        self.produced.append((topic, value))
+
+    def poll(self, timeout):
+        self.poll_calls += 1
+
+    def flush(self):
+        self.flush_calls += 1
+
+
 @pytest.fixture(autouse=True)
-def mock_kafka_producer_class():
-    """Patch KafkaProducer at the import location so no real connection is attempted."""
-    with patch('rss_feeder.kafka_publisher.KafkaProducer', autospec=True) as mock:
-        yield mock
+def dummy_producer_class(monkeypatch):
+    """Pin the kafka-python backend with a stub producer.
+
+    ConfluentProducer is forced to None so the tests exercise the same
+    branch whether or not confluent-kafka is installed; KafkaProducer is
+    swapped at its import site so no real connection is attempted.
+    """
+    monkeypatch.setattr('rss_feeder.kafka_publisher.ConfluentProducer', None)
+    monkeypatch.setattr('rss_feeder.kafka_publisher.KafkaProducer', DummyProducer)
 
 
 @pytest.fixture
-def kafka_publisher(mock_kafka_producer_class):
+def kafka_publisher():
     from rss_feeder.kafka_publisher import KafkaPublisher
     return KafkaPublisher(validate_func=_always_valid)
 
 
-def test_publish_success(kafka_publisher, mock_kafka_producer_class):
+@pytest.mark.parametrize("validate_func,send_error,expected", [
+    (_always_valid, None, True),
+    (_always_invalid, None, False),
+    (_always_valid, Exception("Kafka error"), False),
+], ids=["success", "invalid_message", "kafka_error"])
+def test_publish(validate_func, send_error, expected):
+    from rss_feeder.kafka_publisher import KafkaPublisher
+    publisher = KafkaPublisher(validate_func=validate_func)
+    producer = publisher.producer
+    producer.send_error = send_error
+
     test_message = {
         'title': 'Test Article',
         'link': 'http://example.com',
         'published': '2023-01-01'
     }
 
-    mock_future = Mock()
-    mock_kafka_producer_class.return_value.send.return_value = mock_future
+    result = publisher.publish(config.KAFKA_TOPIC, test_message)
+    assert result is expected
+    if expected:
+        assert producer.sent == [(config.KAFKA_TOPIC, test_message)]
+    elif validate_func is _always_invalid:
+        # Rejected messages go to the dead-letter topic, never the main one
+        assert not any(topic == config.KAFKA_TOPIC for topic, _ in producer.sent)
+
+
+def test_flush_and_close(kafka_publisher):
+    kafka_publisher.flush()
+    assert kafka_publisher.producer.flush_calls == 1
 
-    result = kafka_publisher.publish(config.KAFKA_TOPIC, test_message)
-    assert result is True
-    mock_kafka_producer_class.return_value.send.assert_called_once_with(
-        config.KAFKA_TOPIC,
-        value=test_message
-    )
+    kafka_publisher.close()
+    assert kafka_publisher.producer.close_calls == 1
 
 
-def test_publish_invalid_message(mock_kafka_producer_class):
+def test_publish_many_mixed_batch():
+    from rss_feeder.kafka_publisher import KafkaPublisher
+    publisher = KafkaPublisher(validate_func=lambda m: bool(m.get('title')))
+    producer = publisher.producer
+
+    good = {'title': 'Good', 'link': 'http://example.com', 'published': '2023-01-01'}
+    bad = {'title': ''}
+
+    sent = publisher.publish_many(config.KAFKA_TOPIC, [good, bad, good])
+
+    assert sent == 2
+    assert [m for t, m in producer.sent if t == config.KAFKA_TOPIC] == [good, good]
+    dead = [m for t, m in producer.sent if t == config.KAFKA_DEAD_LETTER_TOPIC]
+    assert [m['original_message'] for m in dead] == [bad]
+
+
+def test_publish_many_validate_disabled():
     from rss_feeder.kafka_publisher import KafkaPublisher
     publisher = KafkaPublisher(validate_func=_always_invalid)
-    invalid_message = {'title': 'Missing required fields'}
+    producer = publisher.producer
+
+    bad = {'title': ''}
 
-    result = publisher.publish(config.KAFKA_TOPIC, invalid_message)
-    assert result is False
+    sent = publisher.publish_many(config.KAFKA_TOPIC, [bad, bad], validate=False)
 
+    assert sent == 2
+    assert producer.sent == [(config.KAFKA_TOPIC, bad), (config.KAFKA_TOPIC, bad)]
+
+
+def test_publish_many_send_error():
+    from rss_feeder.kafka_publisher import KafkaPublisher
+    publisher = KafkaPublisher(validate_func=_always_valid)
+    publisher.producer.send_error = Exception("Kafka error")
+
+    message = {'title': 'T', 'link': 'http://example.com', 'published': '2023-01-01'}
+
+    assert publisher.publish_many(config.KAFKA_TOPIC, [message]) == 0
+
+
+def test_confluent_adapter_publish(monkeypatch):
+    monkeypatch.setattr('rss_feeder.kafka_publisher.ConfluentProducer',
+                        DummyConfluentProducer)
+    from rss_feeder.kafka_publisher import KafkaPublisher
+    publisher = KafkaPublisher(validate_func=_always_valid)
 
-def test_publish_kafka_error(kafka_publisher, mock_kafka_producer_class):
     test_message = {
         'title': 'Test Article',
         'link': 'http://example.com',
         'published': '2023-01-01'
     }
 
-    mock_kafka_producer_class.return_value.send.side_effect = Exception("Kafka error")
-
-    result = kafka_publisher.publish(config.KAFKA_TOPIC, test_message)
-    assert result is False
+    assert publisher.publish(config.KAFKA_TOPIC, test_message) is True
 
+    inner = publisher.producer._producer
+    assert inner.produced == [(config.KAFKA_TOPIC, orjson.dumps(test_message))]
+    assert inner.poll_calls == 1
 
-def test_flush_and_close(kafka_publisher, mock_kafka_producer_class):
-    kafka_publisher.flush()
-    mock_kafka_producer_class.return_value.flush.assert_called_once()
-
-    kafka_publisher.close()
-    mock_kafka_producer_class.return_value.close.assert_called_once()
+    publisher.flush()
+    assert inner.flush_calls == 1
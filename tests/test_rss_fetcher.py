@@ -1,45 +1,67 @@
 # tests/test_rss_fetcher.py
+from collections import namedtuple
+
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
-from rss_feeder.rss_fetcher import RSSFetcher
+from unittest.mock import patch
+from rss_feeder.rss_fetcher import RSSFetcher, _UNCHANGED
 from rss_feeder import config
 
+FakeResponse = namedtuple("FakeResponse", "status_code headers content")
+
+
+class FakeClient:
+    """Stub async HTTP client: returns one canned response, supports async with."""
+
+    def __init__(self, response):
+        self.response = response
+
+    async def get(self, url, headers=None):
+        return self.response
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+@pytest.fixture(scope='session')
+def _shared_fetcher(fetcher_patches):
+    """One RSSFetcher for the whole session; construction is the slow part."""
+    return RSSFetcher(), fetcher_patches
+
 
 @pytest.fixture
-def rss_fetcher():
-    with patch('rss_feeder.rss_fetcher.StorageManager'), \
-         patch('rss_feeder.rss_fetcher.Validator'), \
-         patch('rss_feeder.rss_fetcher.KafkaPublisher'):
-        fetcher = RSSFetcher()
-        return fetcher
+def rss_fetcher(_shared_fetcher):
+    fetcher, mocks = _shared_fetcher
+    for mock in mocks.values():
+        mock.reset_mock()
+    # Undo per-test state: dedup LRU, conditional-GET state, the per-host
+    # rate limiter (a stale slot makes the next fetch to the same host
+    # sleep for real), and any instance override of the class-level bound
+    fetcher._seen_urls.clear()
+    fetcher.feed_state.clear()
+    fetcher._host_next_ok.clear()
+    vars(fetcher).pop('MAX_SEEN_URLS', None)
+    return fetcher
 
 
 @pytest.mark.asyncio
 async def test_fetch_feed_success(rss_fetcher):
-    mock_client = AsyncMock()
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.headers = {}
-    mock_response.content = b'<rss>content</rss>'
-    mock_client.get.return_value = mock_response
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
-    with patch.object(rss_fetcher, '_make_client', return_value=mock_client):
+    client = FakeClient(FakeResponse(200, {}, b'<rss>content</rss>'))
+    with patch.object(rss_fetcher, '_make_client', return_value=client):
         result = await rss_fetcher.fetch_feed("http://test.com", "TestFeed")
         assert result is not None
 
 
 @pytest.mark.asyncio
 async def test_fetch_feed_not_modified(rss_fetcher):
-    mock_client = AsyncMock()
-    mock_response = MagicMock()
-    mock_response.status_code = 304
-    mock_client.get.return_value = mock_response
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
-    with patch.object(rss_fetcher, '_make_client', return_value=mock_client):
+    client = FakeClient(FakeResponse(304, {}, b''))
+    with patch.object(rss_fetcher, '_make_client', return_value=client):
         result = await rss_fetcher.fetch_feed("http://test.com", "TestFeed")
-        assert result is None
+        # 304 is "unchanged", not a failure — the scheduler must not back off
+        assert result is _UNCHANGED
+        assert result.entries == []
 
 
 def test_is_duplicate(rss_fetcher):
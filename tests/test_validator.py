@@ -2,7 +2,6 @@
 
 import os
 import json
-import shutil
 import pytest
 from unittest.mock import MagicMock
 from rss_feeder.validator import Validator
@@ -19,24 +18,42 @@ invalid_article = {
     "link": "",
 }
 
+VALID_FEED_XML = "<rss><channel><title>Test Feed</title></channel></rss>"
+INVALID_FEED_XML = "<html><body>Not RSS</body></html>"
+
+
+@pytest.fixture(scope='session', autouse=True)
+def failed_articles_folder(tmp_path_factory):
+    """Point the failed_articles folder at a session temp dir.
+
+    tmp_path_factory hands each xdist worker its own base directory, so
+    parallel runs stay isolated and nothing lands in the real data/ tree.
+    """
+    original_folder = config.FAILED_ARTICLES_FOLDER
+    config.FAILED_ARTICLES_FOLDER = str(tmp_path_factory.mktemp("failed_articles"))
+    yield config.FAILED_ARTICLES_FOLDER
+    config.FAILED_ARTICLES_FOLDER = original_folder
+
 
 @pytest.fixture(autouse=True)
-def cleanup_failed_articles_folder():
-    """Clean up failed_articles folder before each test."""
-    if os.path.exists(config.FAILED_ARTICLES_FOLDER):
-        shutil.rmtree(config.FAILED_ARTICLES_FOLDER)
-    os.makedirs(config.FAILED_ARTICLES_FOLDER, exist_ok=True)
+def cleanup_failed_articles(failed_articles_folder):
+    """Per-test reset: drop the output file and clear the counter.
+
+    Removing one file is far cheaper than the rmtree/makedirs pair the
+    session fixture pays once.
+    """
+    failed_path = os.path.join(failed_articles_folder, "failed_articles.jsonl")
+    if os.path.exists(failed_path):
+        os.remove(failed_path)
     Validator.failed_articles_counter = {}
 
 
 def test_validate_feed_xml_valid():
-    xml = "<rss><channel><title>Test Feed</title></channel></rss>"
-    assert Validator.validate_feed_xml(xml) is True
+    assert Validator.validate_feed_xml(VALID_FEED_XML) is True
 
 
 def test_validate_feed_xml_invalid():
-    xml = "<html><body>Not RSS</body></html>"
-    assert Validator.validate_feed_xml(xml) is False
+    assert Validator.validate_feed_xml(INVALID_FEED_XML) is False
 
 
 def test_validate_article_valid():
@@ -47,7 +64,8 @@ def test_validate_article_invalid():
     assert Validator.validate_article(invalid_article) is False
 
 
-def test_filter_valid_articles_separates_good_and_bad():
+def test_filter_valid_articles_separates_good_and_bad(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'FAILED_ARTICLES_FOLDER', str(tmp_path))
     mock_kafka = MagicMock()
     validator = Validator(kafka_publisher=mock_kafka)
 
@@ -58,25 +76,28 @@ def test_filter_valid_articles_separates_good_and_bad():
 
     assert valid == [valid_article]
 
-    failed_json_path = os.path.join(config.FAILED_ARTICLES_FOLDER, "failed_articles.json")
-    assert os.path.exists(failed_json_path)
+    failed_jsonl_path = tmp_path / "failed_articles.jsonl"
+    assert failed_jsonl_path.exists()
 
-    with open(failed_json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-        assert feed_name in data
-        assert invalid_article in data[feed_name]
+    records = [json.loads(line) for line in failed_jsonl_path.read_text(encoding='utf-8').splitlines() if line]
+    assert any(r['feed'] == feed_name and r['article'] == invalid_article
+               for r in records)
 
-    mock_kafka.publish.assert_called_once()
+    mock_kafka.publish_many.assert_called_once_with(
+        config.KAFKA_DEAD_LETTER_TOPIC, [invalid_article], validate=False
+    )
 
 
-def test_failed_articles_counter():
+@pytest.mark.parametrize("n", [1, 16, 256])
+def test_failed_articles_counter(n):
     mock_kafka = MagicMock()
     validator = Validator(kafka_publisher=mock_kafka)
 
-    articles = [invalid_article, invalid_article]
+    articles = [invalid_article] * n
     feed_name = "CounterFeed"
 
     validator.filter_valid_articles(articles, feed_name=feed_name)
 
-    assert validator.failed_articles_counter.get(feed_name) == 2
-    assert mock_kafka.publish.call_count == 2
+    assert validator.failed_articles_counter.get(feed_name) == n
+    mock_kafka.publish_many.assert_called_once()
+    assert len(mock_kafka.publish_many.call_args.args[1]) == n